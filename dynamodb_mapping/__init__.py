@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from .dynamodb_mapping import DynamoDBMapping, DynamoDBKeySimplified, DynamoDBItemType
+from .dynamodb_mapping import (
+    DynamoDBMapping,
+    DynamoDBKeySimplified,
+    DynamoDBItemType,
+    ConcurrentModificationError,
+)
 
 __author__ = """Janos Tolgyesi"""
 __email__ = "janos.tolgyesi@gmail.com"
 __version__ = "0.1.2"
-__all__ = ["DynamoDBMapping", "DynamoDBKeySimplified", "DynamoDBItemType"]
+__all__ = [
+    "DynamoDBMapping",
+    "DynamoDBKeySimplified",
+    "DynamoDBItemType",
+    "ConcurrentModificationError",
+]
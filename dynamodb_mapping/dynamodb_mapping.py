@@ -4,6 +4,7 @@ dictionary."""
 from __future__ import annotations
 
 from typing import (
+    Callable,
     Iterator,
     Tuple,
     Union,
@@ -17,13 +18,29 @@ from typing import (
     Sequence,
     cast,
 )
-from collections.abc import ValuesView, ItemsView, KeysView, MutableMapping
+from collections.abc import (
+    Iterable as _AbcIterable,
+    ValuesView,
+    ItemsView,
+    KeysView,
+    MutableMapping,
+)
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+import functools
+import hashlib
+import itertools
 import logging
+import queue
+import threading
+import time
 import warnings
+import weakref
 
 import boto3
-from boto3.dynamodb.types import Binary
+from boto3.dynamodb.types import Binary, TypeSerializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 try:
     import mypy_boto3_dynamodb
@@ -95,19 +112,131 @@ DynamoDBItemType = Mapping[str, DynamoDBValue]
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+"""The default maximum number of the pooled HTTP connections of the DynamoDB client."""
+
+_MISSING = object()
+
+BATCH_GET_MAX_KEYS = 100
+"""The maximum number of keys that can be retrieved in a single BatchGetItem call."""
+
+_RETRY_BASE_DELAY = 0.05
+_RETRY_MAX_DELAY = 5.0
+
+# The boto3 sessions created from credentials by the mappings, held only while a mapping uses
+# them and keyed by a fingerprint of their configuration, and the DynamoDB resources of the
+# sessions, keyed by the resource configuration.
+_session_cache: (
+    "weakref.WeakValueDictionary[Tuple[Optional[str], ...], boto3.Session]"
+) = weakref.WeakValueDictionary()
+_default_boto3_session: Optional[boto3.Session] = None
+_resource_cache: (
+    "weakref.WeakKeyDictionary[boto3.Session, Dict[Tuple[Any, ...], Any]]"
+) = weakref.WeakKeyDictionary()
+_cache_lock = threading.Lock()
+
+# Threads are started only on the first submitted task.
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="dynamodb_mapping_prefetch"
+)
+
+_serializer = TypeSerializer()
+
+
+class ConcurrentModificationError(Exception):
+    """Raised when an item could not be modified because it was modified concurrently, that is,
+    its version number in the table differs from the expected one."""
+
+
+def _cached_session(
+    cache_key: Tuple[Optional[str], ...], factory: Callable[[], boto3.Session]
+) -> boto3.Session:
+    with _cache_lock:
+        session = _session_cache.get(cache_key)
+        if session is None:
+            session = _session_cache[cache_key] = factory()
+        return session
+
 
 def _boto3_session_from_config(config: Dict[str, Any]) -> Optional[boto3.Session]:
     if "aws_access_key_id" in config and "aws_secret_access_key" in config:
-        return boto3.Session(
-            aws_access_key_id=config["aws_access_key_id"],
-            aws_secret_access_key=config["aws_secret_access_key"],
-            region_name=config.get("aws_region"),
-            profile_name=config.get("aws_profile"),
+        session_kwargs = {
+            "aws_access_key_id": config["aws_access_key_id"],
+            "aws_secret_access_key": config["aws_secret_access_key"],
+            "region_name": config.get("aws_region"),
+            "profile_name": config.get("aws_profile"),
+        }
+        # The secret key itself is not kept in the cache.
+        cache_key = (
+            session_kwargs["aws_access_key_id"],
+            hashlib.sha256(
+                session_kwargs["aws_secret_access_key"].encode()
+            ).hexdigest(),
+            session_kwargs["region_name"],
+            session_kwargs["profile_name"],
         )
+        return _cached_session(cache_key, lambda: boto3.Session(**session_kwargs))
     else:
         return None
 
 
+def _default_session() -> boto3.Session:
+    global _default_boto3_session
+    with _cache_lock:
+        if _default_boto3_session is None:
+            _default_boto3_session = boto3.Session()
+        return _default_boto3_session
+
+
+def _freeze_option(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze_option(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_option(v) for v in value)
+    return value
+
+
+def _config_cache_key(config: Config) -> Optional[Tuple[Any, ...]]:
+    """Returns a hashable form of the option values of a botocore config, so that equal configs
+    share a resource. Returns None if an option value is not hashable."""
+    key = tuple(
+        (name, _freeze_option(getattr(config, name, None)))
+        for name in Config.OPTION_DEFAULTS
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_dynamodb_resource(
+    session: boto3.Session,
+    retry_mode: str,
+    max_attempts: int,
+    config: Optional[Config] = None,
+) -> Any:
+    """Returns the DynamoDB service resource of the session, creating it only once for each
+    session and configuration, so that the mappings share the client and its connection pool.
+    """
+    resource_config = Config(
+        max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={"mode": retry_mode, "max_attempts": max_attempts},
+    )
+    if config:
+        resource_config = resource_config.merge(config)
+    config_key = _config_cache_key(resource_config)
+    if config_key is None:
+        # The resource is not shared, and it is released together with the mapping.
+        return session.resource("dynamodb", config=resource_config)
+    with _cache_lock:
+        resources = _resource_cache.setdefault(session, {})
+        if config_key not in resources:
+            resources[config_key] = session.resource("dynamodb", config=resource_config)
+        return resources[config_key]
+
+
 def get_key_names(table: DynamoDBTable) -> DynamoDBKeyName:
     """Gets the key names of the DynamoDB table.
 
@@ -142,7 +271,11 @@ def simplify_tuple_keys(key: DynamoDBKeyAny) -> DynamoDBKeySimplified:
         return cast(DynamoDBKeyComposite, key)
 
 
-def create_tuple_keys(key: DynamoDBKeySimplified) -> DynamoDBKeyAny:
+def create_tuple_keys(
+    key: DynamoDBKeySimplified,
+    _primitive_types: Tuple[type, ...] = DynamoDBKeyPrimitiveTypes,
+    _iterable: type = _AbcIterable,
+) -> DynamoDBKeyAny:
     """Creates a well-defined DynamoDB key from a simplified key.
 
     If the simplified key is of a primitive type, it is returned as a one-element tuple. If it
@@ -155,12 +288,107 @@ def create_tuple_keys(key: DynamoDBKeySimplified) -> DynamoDBKeyAny:
     Returns:
         DynamoDBKeyAny: The well-defined DynamoDB key.
     """
-    if not isinstance(key, DynamoDBKeyPrimitiveTypes) and isinstance(key, Iterable):
+    # The types are bound as default arguments to be looked up as fast locals.
+    if not isinstance(key, _primitive_types) and isinstance(key, _iterable):
         return cast(DynamoDBKeyComposite, tuple(key))
     else:
         return cast(DynamoDBKeySimple, (key,))
 
 
+def _retry_delay(attempt: int) -> float:
+    """Returns the exponential backoff delay in seconds before the given retry attempt."""
+    return min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2**attempt))
+
+
+def _has_empty_set(serialized: Dict[str, Any]) -> bool:
+    ((attribute_type, attribute_value),) = serialized.items()
+    if attribute_type in ("SS", "NS", "BS"):
+        return not attribute_value
+    if attribute_type == "L":
+        return any(_has_empty_set(v) for v in attribute_value)
+    if attribute_type == "M":
+        return any(_has_empty_set(v) for v in attribute_value.values())
+    return False
+
+
+def _can_be_expression_value(value: Any) -> bool:
+    """Checks if a value can be sent to DynamoDB as an expression attribute value. Python floats,
+    for example, are rejected by the boto3 serializer, and empty sets by DynamoDB."""
+    try:
+        serialized = _serializer.serialize(value)
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+    return not _has_empty_set(serialized)
+
+
+def _projected(read_kwargs: Dict[str, Any]) -> bool:
+    """Checks if the parameters of a read operation retrieve only some attributes of the items."""
+    return "ProjectionExpression" in read_kwargs or "AttributesToGet" in read_kwargs
+
+
+def _projection_params(attribute_names: Iterable[str]) -> Dict[str, Any]:
+    """Creates the projection parameters of a read operation that retrieves only the specified
+    attributes. The attribute names are aliased to avoid collisions with DynamoDB reserved words.
+    """
+    names = {f"#p{idx}": name for idx, name in enumerate(attribute_names)}
+    return {"ProjectionExpression": ", ".join(names), "ExpressionAttributeNames": names}
+
+
+@functools.lru_cache(maxsize=512)
+def _build_update_template(
+    attribute_keys: Tuple[str, ...],
+    remove_mask: Tuple[bool, ...],
+    version_attribute: Optional[str],
+) -> Tuple[str, Dict[str, str]]:
+    """Builds the update expression and the attribute name placeholders of an update_item
+    operation. The result is cached for the recurring modification shapes, so the returned
+    dictionary must not be modified."""
+    attribute_names = {f"#key{idx}": key for idx, key in enumerate(attribute_keys)}
+    set_expression_parts = [
+        f"#key{idx} = :value{idx}"
+        for idx, remove in enumerate(remove_mask)
+        if not remove
+    ]
+    remove_expression_parts = [
+        f"#key{idx}" for idx, remove in enumerate(remove_mask) if remove
+    ]
+    if version_attribute:
+        attribute_names["#version"] = version_attribute
+        set_expression_parts.append("#version = :next_version")
+    update_expression_parts = []
+    if set_expression_parts:
+        update_expression_parts.append("set " + ", ".join(set_expression_parts))
+    if remove_expression_parts:
+        update_expression_parts.append("remove " + ", ".join(remove_expression_parts))
+    return " ".join(update_expression_parts), attribute_names
+
+
+def _prefetch_pages(pages: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yields the pages of a scan, requesting the next page in the background while the current
+    page is being consumed."""
+    future = _prefetch_executor.submit(next, pages, None)
+    while True:
+        page = future.result()
+        if page is None:
+            return
+        future = _prefetch_executor.submit(next, pages, None)
+        yield page
+
+
+def _unique_key_params(
+    key_params: Iterable[Dict[str, DynamoDBKeyPrimitive]],
+) -> Iterator[Dict[str, DynamoDBKeyPrimitive]]:
+    """Filters out the repeated keys: BatchGetItem rejects requests with duplicate keys."""
+    seen: Set[Tuple[Any, ...]] = set()
+    for params in key_params:
+        key_values = tuple(
+            bytes(v) if isinstance(v, bytearray) else v for v in params.values()
+        )
+        if key_values not in seen:
+            seen.add(key_values)
+            yield params
+
+
 def _log_keys_from_params(key_params: Dict[str, DynamoDBKeyPrimitive]) -> str:
     log_keys = list(key_params.values())
     res = log_keys[0] if len(log_keys) == 1 else log_keys
@@ -172,20 +400,93 @@ class DynamoDBValuesView(ValuesView):
 
     The original implementation of ValuesView would first call a scan operation on the table,
     discard everything except the key values, and then call a get_item operation on each key.
-    This implementation calls only scan once.
+    This implementation calls only scan once. When checking if a mapping is contained in the view,
+    the item is retrieved with a single get_item operation if the mapping contains the key
+    attributes of the table. A mapping without the key attributes can not be equal to a complete
+    item, so it is only searched for in a projected view. A mapping that is searched for in a
+    projected view, or whose key values can not be sent to DynamoDB as keys, is looked up with a
+    scan, filtered on the server side to the items with the same attribute values if all of them
+    can be sent to DynamoDB.
+
+    Args:
+        mapping (DynamoDBMapping): The mapping this view is created on.
+        projection (Sequence[str]): The optional names of the item attributes to be retrieved. If
+            not specified, all attributes are retrieved.
     """
 
-    def __init__(self, mapping: "DynamoDBMapping") -> None:
+    __slots__ = ("_projection",)
+
+    def __init__(
+        self, mapping: "DynamoDBMapping", projection: Optional[Sequence[str]] = None
+    ) -> None:
         self._mapping = mapping
+        self._projection = projection
+
+    def _read_kwargs(self) -> Dict[str, Any]:
+        return _projection_params(self._projection) if self._projection else {}
+
+    def _key_params(
+        self, value: Mapping
+    ) -> Optional[Dict[str, Union[DynamoDBKeyPrimitive, Binary]]]:
+        """Returns the key parameters of a get_item operation from the key attributes of the
+        value, or None if a key value has a type that can not be sent to DynamoDB as a key."""
+        key_params = {}
+        for name in self._mapping.key_names:
+            key = value[name]
+            # The binary key values of the items read from DynamoDB are Binary instances.
+            if not isinstance(key, (*DynamoDBKeyPrimitiveTypes, Binary)) or isinstance(
+                key, bool
+            ):
+                return None
+            key_params[name] = key
+        return key_params
 
     def __contains__(self, value: object) -> bool:
-        for v in self._mapping.scan():
+        scan_kwargs = self._read_kwargs()
+        key_params = None
+        if isinstance(value, Mapping):
+            if not all(name in value for name in self._mapping.key_names):
+                if not self._projection:
+                    # Every stored item contains the key attributes.
+                    return False
+            else:
+                key_params = self._key_params(value)
+        if key_params is not None:
+            # An item equal to the value can only be stored under the keys of the value.
+            try:
+                response = self._mapping.table.get_item(
+                    Key=key_params, **self._mapping._read_kwargs(scan_kwargs)
+                )
+            except ClientError as error:
+                # The key values do not match the key schema, e.g. a string for a number key.
+                if error.response["Error"]["Code"] == "ValidationException":
+                    return False
+                raise
+            return "Item" in response and response["Item"] == value
+        if (
+            isinstance(value, Mapping)
+            and value
+            and all(_can_be_expression_value(v) for v in value.values())
+        ):
+            # Let DynamoDB send back only the items having the same attribute values.
+            filter_names = {f"#f{idx}": name for idx, name in enumerate(value.keys())}
+            scan_kwargs["FilterExpression"] = " AND ".join(
+                f"#f{idx} = :f{idx}" for idx in range(len(filter_names))
+            )
+            scan_kwargs["ExpressionAttributeNames"] = {
+                **scan_kwargs.get("ExpressionAttributeNames", {}),
+                **filter_names,
+            }
+            scan_kwargs["ExpressionAttributeValues"] = {
+                f":f{idx}": v for idx, v in enumerate(value.values())
+            }
+        for v in self._mapping.scan(**scan_kwargs):
             if v is value or v == value:
                 return True
         return False
 
     def __iter__(self) -> Iterator:
-        yield from self._mapping.scan()
+        yield from self._mapping.scan(**self._read_kwargs())
 
 
 class DynamoDBItemsView(ItemsView):
@@ -194,13 +495,40 @@ class DynamoDBItemsView(ItemsView):
     The original implementation of ValuesView would first call a scan operation on the table,
     discard everything except the key values, and then call a get_item operation on each key.
     This implementation calls only scan once.
+
+    Args:
+        mapping (DynamoDBMapping): The mapping this view is created on.
+        projection (Sequence[str]): The optional names of the item attributes to be retrieved. If
+            specified, the key attributes of the table are always retrieved too. If not
+            specified, all attributes are retrieved.
     """
 
-    def __init__(self, mapping: "DynamoDBMapping") -> None:
+    __slots__ = ("_projection",)
+
+    def __init__(
+        self, mapping: "DynamoDBMapping", projection: Optional[Sequence[str]] = None
+    ) -> None:
         self._mapping = mapping
+        self._projection = (
+            tuple(dict.fromkeys((*mapping.key_names, *projection)))
+            if projection
+            else None
+        )
+
+    def _read_kwargs(self) -> Dict[str, Any]:
+        return _projection_params(self._projection) if self._projection else {}
+
+    def __contains__(self, item: object) -> bool:
+        key, value = cast(Tuple[DynamoDBKeySimplified, Any], item)
+        try:
+            v = self._mapping.get_item(key, **self._read_kwargs())
+        except KeyError:
+            return False
+        else:
+            return v is value or v == value
 
     def __iter__(self):
-        for item in self._mapping.scan():
+        for item in self._mapping.scan(**self._read_kwargs()):
             key_values = self._mapping._key_values_from_item(item)
             key_values = simplify_tuple_keys(key_values)
             yield (key_values, item)
@@ -209,16 +537,13 @@ class DynamoDBItemsView(ItemsView):
 class DynamoDBKeysView(KeysView):
     """Efficient implementation of python dict KeysView on DynamoDBMapping types."""
 
+    __slots__ = ()
+
     def __init__(self, mapping: "DynamoDBMapping") -> None:
         self._mapping = mapping
 
     def __contains__(self, key: object) -> bool:
-        try:
-            self._mapping[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self._mapping._exists(cast(DynamoDBKeySimplified, key))
 
 
 class DynamoDBItemAccessor(dict):
@@ -228,24 +553,48 @@ class DynamoDBItemAccessor(dict):
     This is an internal helper class and most likely, users of `DynamoDBMapping` will not need to
     use it.
 
+    If the parent mapping has a ``version_attribute``, the modifications are performed with
+    optimistic locking: a modification fails with :class:`ConcurrentModificationError` if the item
+    was modified by someone else since it was retrieved. Items without a version number in this
+    attribute are treated as version 0. If the version attribute was not retrieved with the item,
+    its version number is unknown, and the modifications are performed without locking.
+
     Args:
         parent (DynamoDBMapping): The parent mapping that created this accessor.
         item_keys (DynamoDBKeySimplified): The keys of the item this accessor is modifying.
         initial_data (Dict): The initial item data.
+        version_retrieved (bool): Whether the version attribute was requested with the item data.
     """
 
+    __slots__ = ("_parent", "_item_keys", "_version")
+
     def __init__(
         self,
         parent: "DynamoDBMapping",
         item_keys: DynamoDBKeySimplified,
         initial_data: DynamoDBItemType,
+        version_retrieved: bool = True,
     ) -> None:
         self._parent = parent
         self._item_keys = item_keys
+        self._version = (
+            cast(Optional[int], initial_data.get(parent.version_attribute))
+            if parent.version_attribute
+            else None
+        )
+        if self._version is None and parent.version_attribute and version_retrieved:
+            self._version = 0
         super().__init__(initial_data)
 
     def __setitem__(self, __key: Any, __value: Any) -> None:
-        self._parent.modify_item(self._item_keys, {__key: __value})
+        if self._version is None:
+            self._parent.modify_item(self._item_keys, {__key: __value})
+        else:
+            self._parent.modify_item(
+                self._item_keys, {__key: __value}, expected_version=self._version
+            )
+            self._version += 1
+            super().__setitem__(self._parent.version_attribute, self._version)
         return super().__setitem__(__key, __value)
 
 
@@ -264,6 +613,9 @@ class DynamoDBMapping(MutableMapping):
     - Pass ``aws_access_key_id`` and ``aws_secret_access_key`` as keyword arguments. Additionally,
       the optional ``aws_region`` and ``aws_profile`` arguments are also considered.
 
+    The mappings created with the same session (or with the same configuration arguments) share
+    a single DynamoDB resource, and thus the underlying client and its connection pool.
+
     Example::
 
         from dynamodb_mapping import DynamoDBMapping
@@ -294,8 +646,8 @@ class DynamoDBMapping(MutableMapping):
     The ``__len__`` implementation of this class returns a best-effort estimate of the number of
     items in the table using the TableDescription DynamoDB API. The number of items are updated
     at DynamoDB service side approximately once in every 6 hours. If you need the exact number of
-    items currently in the table, you can use ``len(list(mapping.keys()))``. Note however that this
-    will cause to run an exhaustive scan operation on your table.
+    items currently in the table, you can use :meth:`exact_len`. Note however that this will cause
+    to run an exhaustive scan operation on your table.
 
     DynamoDB tables may be configured with a simple primary key (a partition key only) or a
     composite primary key (a partition key plus a sort key). If your table is configured with a
@@ -318,6 +670,21 @@ class DynamoDBMapping(MutableMapping):
     Args:
         table_name: The name of the DynamoDB table.
         boto3_session: An optional preconfigured boto3 Session object.
+        retry_mode: The botocore retry mode of the DynamoDB client. The default ``"adaptive"``
+            mode retries throttled requests and also limits the client-side request rate when
+            the table is throttling.
+        max_attempts: The maximum number of attempts of a request, including the first one.
+        config: An optional botocore configuration of the DynamoDB client. By default, the client
+            keeps up to ``DEFAULT_MAX_POOL_CONNECTIONS`` connections alive, so that the parallel
+            scans and concurrent callers do not need to open new connections. The options set
+            in this configuration override the defaults and the retry arguments above.
+        consistent_read: If True, strongly consistent reads are used by default in the read
+            operations (get_item, get_many, scan and the views). You can still override this
+            per call with the ``ConsistentRead`` keyword argument.
+        version_attribute: The name of the item attribute that holds the version number used for
+            optimistic locking, for example ``"_version"``. If specified, the items retrieved with
+            a version number are modified with :meth:`modify_item` ``expected_version`` checks.
+            Defaults to None, that disables optimistic locking.
         **kwargs: Additional keyword parameters for manual configuration of the boto3 client:
             ``aws_access_key_id``, ``aws_secret_access_key``, ``aws_region``, ``aws_profile``.
     """
@@ -326,53 +693,261 @@ class DynamoDBMapping(MutableMapping):
         self,
         table_name: str,
         boto3_session: Optional[boto3.session.Session] = None,
+        retry_mode: str = "adaptive",
+        max_attempts: int = 10,
+        config: Optional[Config] = None,
+        consistent_read: bool = False,
+        version_attribute: Optional[str] = None,
         **kwargs,
     ) -> None:
         session = (
             boto3_session
             or kwargs.get("boto3_session")
             or _boto3_session_from_config(kwargs)
-            or boto3.Session()
+            or _default_session()
         )
-        dynamodb = session.resource("dynamodb")
+        # The cached sessions and their resources are kept only while a mapping references them.
+        self._session = session
+        dynamodb = _get_dynamodb_resource(session, retry_mode, max_attempts, config)
         self.table = dynamodb.Table(table_name)
+        # The client of the table resource is configured by boto3 to accept and return native
+        # Python types in place of the DynamoDB typed values, just like the table resource.
+        self._client = self.table.meta.client
+        self.consistent_read = consistent_read
+        self.version_attribute = version_attribute
         self.key_names = get_key_names(self.table)
+        self._key_count = len(self.key_names)
+        self._single_key = self._key_count == 1
+        self._pk_name = self.key_names[0]
+        self._key_projection = {
+            **_projection_params(self.key_names),
+            "Select": "SPECIFIC_ATTRIBUTES",
+        }
+        self._create_key_param: Callable[
+            [DynamoDBKeySimplified], Dict[str, DynamoDBKeyPrimitive]
+        ] = (
+            self._create_key_param_single
+            if self._single_key
+            else self._create_key_param_composite
+        )
+        self._key_values_from_item: Callable[[DynamoDBItemType], DynamoDBKeyAny] = (
+            self._key_values_from_item_single
+            if self._single_key
+            else self._key_values_from_item_composite
+        )
 
-    def _create_key_param(
+    def _create_key_param_single(
+        self, keys: DynamoDBKeySimplified
+    ) -> Dict[str, DynamoDBKeyPrimitive]:
+        if isinstance(keys, DynamoDBKeyPrimitiveTypes):
+            return {self._pk_name: keys}
+        return self._create_key_param_composite(keys)
+
+    def _create_key_param_composite(
         self, keys: DynamoDBKeySimplified
     ) -> Dict[str, DynamoDBKeyPrimitive]:
         tuple_keys = create_tuple_keys(keys)
-        if len(tuple_keys) != len(self.key_names):
+        if len(tuple_keys) != self._key_count:
             raise ValueError(
                 f"You must provide a value for each of {self.key_names} keys."
             )
-        param = {name: value for name, value in zip(self.key_names, tuple_keys)}
-        return param
+        return dict(zip(self.key_names, tuple_keys))
+
+    def _read_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.consistent_read and "ConsistentRead" not in kwargs:
+            return {**kwargs, "ConsistentRead": True}
+        return kwargs
+
+    def _create_item(
+        self, keys: DynamoDBKeySimplified, item: DynamoDBItemType
+    ) -> Dict[str, DynamoDBValue]:
+        # The key attributes override any attribute with the same name in the item.
+        return {**item, **self._create_key_param(keys)}
+
+    def _scan_pages(
+        self, page_size: Optional[int] = None, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        paginator = self._client.get_paginator("scan")
+        pagination_config = {"PageSize": page_size} if page_size else {}
+        return iter(
+            paginator.paginate(
+                TableName=self.table.name,
+                PaginationConfig=pagination_config,
+                **self._read_kwargs(kwargs),
+            )
+        )
 
-    def scan(self, **kwargs) -> Iterator[DynamoDBItemType]:
+    def _parallel_scan_pages(
+        self, total_segments: int, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        pages: queue.Queue = queue.Queue(maxsize=total_segments * 2)
+        stop = threading.Event()
+        segment_done = object()
+
+        def scan_segment(segment: int) -> None:
+            try:
+                for response in self._scan_pages(
+                    **kwargs, Segment=segment, TotalSegments=total_segments
+                ):
+                    if stop.is_set():
+                        return
+                    pages.put(response)
+                    # Do not request the next page if the consumer stopped while waiting.
+                    if stop.is_set():
+                        return
+            except Exception as error:
+                pages.put(error)
+            finally:
+                pages.put(segment_done)
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            for segment in range(total_segments):
+                executor.submit(scan_segment, segment)
+            running = total_segments
+            try:
+                while running:
+                    response = pages.get()
+                    if response is segment_done:
+                        running -= 1
+                    elif isinstance(response, Exception):
+                        raise response
+                    else:
+                        yield response
+            finally:
+                # Unblock the workers still waiting to put a page into the queue.
+                stop.set()
+                while running:
+                    if pages.get() is segment_done:
+                        running -= 1
+
+    def _pages(
+        self, parallel: int, prefetch: bool = False, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        if parallel < 1:
+            raise ValueError("The number of parallel segments must be at least 1.")
+        if parallel == 1:
+            pages = self._scan_pages(**kwargs)
+            return _prefetch_pages(pages) if prefetch else pages
+        elif "Segment" in kwargs or "TotalSegments" in kwargs:
+            raise ValueError("parallel can not be used together with Segment.")
+        else:
+            # The segment threads already fetch ahead into the page queue.
+            return self._parallel_scan_pages(parallel, **kwargs)
+
+    def scan(
+        self,
+        parallel: int = 1,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_items: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[DynamoDBItemType]:
         """Performs a scan operation on the DynamoDB table. The scan is executed in a lazy manner,
         in that the successive pages are queried only on demand.
 
+        If ``parallel`` is greater than one, the table is divided into this many segments that are
+        scanned concurrently in separate threads, and the items of all segments are merged into
+        the returned iterator. In this case, the order of the items is not deterministic. Only a
+        limited number of pages are buffered, so the segments are scanned only as fast as the
+        items are consumed.
+
         Example::
 
             for item in mapping.scan():
                 print(item)
 
+            for item in mapping.scan(parallel=4):
+                print(item)
+
         Args:
+            parallel: The number of segments to scan concurrently. Defaults to 1, that performs
+                a serial scan.
+            page_size: The maximum number of items to be evaluated in a single scan request.
+                Smaller pages reach the consumer sooner. If not specified, each page contains up
+                to 1 MB of data.
+            prefetch: If True, the next page is requested in a background thread while the items
+                of the current page are being consumed. This hides the latency of the requests
+                if the processing of the items takes time, at the cost of requesting one page
+                ahead even if the iteration is stopped early. Parallel scans always fetch ahead.
+            max_items: The maximum number of items to return. Unless a ``FilterExpression`` is
+                passed, the page size is limited to this number too, so that the scan does not
+                read more items than needed. DynamoDB applies the page size before the filter, so
+                filtered scans keep the requested ``page_size``.
             **kwargs: keyword arguments to be passed to the underlying DynamoDB
                 :meth:`~DynamoDBTable.scan` operation.
 
+        Raises:
+            ValueError: If ``parallel`` or ``max_items`` is less than one, or if ``parallel`` is
+                greater than one and ``Segment`` or ``TotalSegments`` is also passed.
+
         Returns:
             An iterator over all items in the table.
         """
+        if max_items is not None:
+            if max_items < 1:
+                raise ValueError("max_items must be at least 1.")
+            if "FilterExpression" not in kwargs:
+                page_size = min(page_size, max_items) if page_size else max_items
         logger.debug("Performing a scan operation on %s table", self.table.name)
-        response = self.table.scan(**kwargs)
-        for item in response["Items"]:
-            yield item
-        while "LastEvaluatedKey" in response:
-            response = self.table.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-            for item in response["Items"]:
-                yield item
+        pages = self._pages(parallel, prefetch=prefetch, page_size=page_size, **kwargs)
+        items = itertools.chain.from_iterable(response["Items"] for response in pages)
+        yield from itertools.islice(items, max_items)
+
+    def exact_len(self, parallel: int = 1, **kwargs) -> int:
+        """Counts the exact number of items currently in the table.
+
+        This method performs an exhaustive scan operation on the table with ``Select="COUNT"``,
+        so only the number of matching items is transferred for each page instead of the items
+        themselves. The consumed read capacity is the same as that of a full scan.
+
+        Example::
+
+            print(mapping.exact_len())
+
+        Args:
+            parallel: The number of segments to scan concurrently, see :meth:`scan`.
+            **kwargs: keyword arguments to be passed to the underlying DynamoDB
+                :meth:`~DynamoDBTable.scan` operation, for example a ``FilterExpression``.
+
+        Raises:
+            ValueError: If ``parallel`` is less than one.
+
+        Returns:
+            The number of items in the table.
+        """
+        logger.debug("Performing a count scan operation on %s table", self.table.name)
+        return sum(
+            response["Count"]
+            for response in self._pages(parallel, **kwargs, Select="COUNT")
+        )
+
+    def count(self, exact: bool = False, **kwargs) -> int:
+        """Returns the number of items in the table.
+
+        By default this is the estimation that DynamoDB updates approximately every six hours,
+        that is also returned by ``len(mapping)``. With ``exact=True`` the items are counted
+        with :meth:`exact_len` instead.
+
+        Example::
+
+            print(mapping.count(exact=True))
+
+        Args:
+            exact: If True, count the items with a ``Select="COUNT"`` scan.
+            **kwargs: keyword arguments to be passed to :meth:`exact_len`. They can be specified
+                only if ``exact`` is True.
+
+        Raises:
+            ValueError: If ``kwargs`` are specified without ``exact``.
+
+        Returns:
+            The number of items in the table.
+        """
+        if exact:
+            return self.exact_len(**kwargs)
+        if kwargs:
+            raise ValueError("Scan arguments can be specified only for exact counts")
+        return len(self)
 
     def get_item(self, keys: DynamoDBKeySimplified, **kwargs) -> DynamoDBItemAccessor:
         """Retrieves a single item from the table.
@@ -407,11 +982,121 @@ class DynamoDBMapping(MutableMapping):
         """
         key_params = self._create_key_param(keys)
         logger.debug("Performing a get_item operation on %s table", self.table.name)
-        response = self.table.get_item(Key=key_params, **kwargs)
+        response = self.table.get_item(Key=key_params, **self._read_kwargs(kwargs))
         if "Item" not in response:
             raise KeyError(_log_keys_from_params(key_params))
         data = response["Item"]
-        return DynamoDBItemAccessor(parent=self, item_keys=keys, initial_data=data)
+        return DynamoDBItemAccessor(
+            parent=self,
+            item_keys=keys,
+            initial_data=data,
+            version_retrieved=not _projected(kwargs),
+        )
+
+    def get_many(
+        self,
+        keys: Iterable[DynamoDBKeySimplified],
+        projection: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> Iterator[DynamoDBItemAccessor]:
+        """Retrieves multiple items from the table using as few requests as possible.
+
+        The keys are grouped into DynamoDB ``BatchGetItem`` requests of at most
+        ``BATCH_GET_MAX_KEYS`` keys each. The keys that DynamoDB does not process in a request (for
+        example, because of throttling or response size limits) are resubmitted with an
+        exponential backoff. The batches are requested lazily, as the returned iterator is
+        consumed.
+
+        Keys that do not exist in the table are silently skipped, and duplicate keys are requested
+        only once. Note that the order of the returned items is not guaranteed to follow the order
+        of the keys.
+
+        Example::
+
+            for item in mapping.get_many(["my_key", "my_other_key"]):
+                print(item)
+
+            for item in mapping.get_many(["my_key", "my_other_key"], projection=["title"]):
+                print(item["title"])
+
+        Args:
+            keys: An iterable of key values. Each key value can either be a simple Python type,
+                if only the partition key is specified in the table's key schema, or a tuple of the
+                partition key and the range key values, if both are specified in the key schema.
+            projection: The optional names of the item attributes to be retrieved. The key
+                attributes of the table, and the ``version_attribute`` of the mapping if set, are
+                always retrieved. If not specified, all attributes are retrieved.
+            **kwargs: keyword arguments to be added to the table's request parameters in the
+                underlying DynamoDB :meth:`~DynamoDBServiceResource.batch_get_item` operation,
+                for example ``ConsistentRead``.
+
+        Raises:
+            ValueError: If the required key values are not specified, or if a
+                ``ProjectionExpression`` is passed in the keyword arguments instead of
+                ``projection``.
+
+        Returns:
+            An iterator over dictionary wrappers of the retrieved items.
+        """
+        if "ProjectionExpression" in kwargs:
+            raise ValueError(
+                "Use the projection argument instead of ProjectionExpression: the key "
+                "attributes of the items must always be retrieved."
+            )
+        if projection:
+            attribute_names = (*self.key_names, *projection)
+            if self.version_attribute:
+                attribute_names += (self.version_attribute,)
+            kwargs = {
+                **kwargs,
+                **_projection_params(dict.fromkeys(attribute_names)),
+            }
+        version_retrieved = not _projected(kwargs) or bool(projection)
+        table_name = self.table.name
+        key_params_iter = _unique_key_params(self._create_key_param(k) for k in keys)
+        pending: List[Dict[str, DynamoDBKeyPrimitive]] = []
+        attempt = 0
+        while True:
+            missing = max(0, BATCH_GET_MAX_KEYS - len(pending))
+            pending.extend(itertools.islice(key_params_iter, missing))
+            if not pending:
+                return
+            batch = pending[:BATCH_GET_MAX_KEYS]
+            pending = pending[BATCH_GET_MAX_KEYS:]
+            logger.debug(
+                "Performing a batch_get_item operation with %d keys on %s table",
+                len(batch),
+                table_name,
+            )
+            response = self._client.batch_get_item(
+                RequestItems={table_name: {**self._read_kwargs(kwargs), "Keys": batch}}
+            )
+            for item in response.get("Responses", {}).get(table_name, []):
+                item_keys = simplify_tuple_keys(self._key_values_from_item(item))
+                yield DynamoDBItemAccessor(
+                    parent=self,
+                    item_keys=item_keys,
+                    initial_data=item,
+                    version_retrieved=version_retrieved,
+                )
+            unprocessed = response.get("UnprocessedKeys", {}).get(table_name)
+            if unprocessed and unprocessed.get("Keys"):
+                pending = unprocessed["Keys"] + pending
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
+            else:
+                attempt = 0
+
+    def _exists(self, keys: DynamoDBKeySimplified) -> bool:
+        key_params = self._create_key_param(keys)
+        logger.debug("Performing a get_item operation on %s table", self.table.name)
+        response = self.table.get_item(
+            Key=key_params,
+            ProjectionExpression="#k0",
+            ExpressionAttributeNames={"#k0": self._pk_name},
+            **self._read_kwargs({}),
+        )
+        return "Item" in response
 
     def set_item(
         self, keys: DynamoDBKeySimplified, item: DynamoDBItemType, **kwargs
@@ -426,17 +1111,13 @@ class DynamoDBMapping(MutableMapping):
             keys: The key value. This can either be a simple Python type,
                 if only the partition key is specified in the table's key schema, or a tuple of the
                 partition key and the range key values, if both are specified in the key schema.
-            item: The new item.
+            item: The new item. If the item contains the key attributes too, they are
+                overridden by the values in ``keys``.
             **kwargs: keyword arguments to be passed to the underlying DynamoDB
                 :meth:`~DynamoDBTable.set_item` operation.
 
         """
-        key_params = self._create_key_param(keys)
-        _item = {}
-        for k, v in item.items():
-            _item[k] = v
-        for k, v in key_params.items():
-            _item[k] = v
+        _item = self._create_item(keys, item)
         logger.debug("Performing a put_item operation on %s table", self.table.name)
         self.table.put_item(Item=_item, **kwargs)
 
@@ -446,6 +1127,34 @@ class DynamoDBMapping(MutableMapping):
         """An alias for the ``set_item`` method."""
         self.set_item(keys, item, **kwargs)
 
+    def set_many(
+        self, items: Iterable[Tuple[DynamoDBKeySimplified, DynamoDBItemType]]
+    ) -> None:
+        """Create or overwrite multiple items in the table using as few requests as possible.
+
+        The items are buffered and written in DynamoDB ``BatchWriteItem`` requests of at most 25
+        items each. The items that DynamoDB does not process in a request are automatically
+        resubmitted. If the same key is written more times, only the last item is kept. Note that
+        batch writes do not support conditional writes.
+
+        Example::
+
+            mapping.set_many([
+                ("my_key", {"name": "my first object"}),
+                ("my_other_key", {"name": "my second object"}),
+            ])
+
+        Args:
+            items: An iterable of (key, item) tuples. The key value can either be a simple Python
+                type, if only the partition key is specified in the table's key schema, or a tuple
+                of the partition key and the range key values, if both are specified in the key
+                schema.
+        """
+        logger.debug("Performing a batch write operation on %s table", self.table.name)
+        with self.table.batch_writer(overwrite_by_pkeys=list(self.key_names)) as batch:
+            for keys, item in items:
+                batch.put_item(Item=self._create_item(keys, item))
+
     def del_item(
         self, keys: DynamoDBKeySimplified, check_existing=True, **kwargs
     ) -> None:
@@ -459,20 +1168,67 @@ class DynamoDBMapping(MutableMapping):
             keys: The key value. This can either be a simple Python type, if only the partition key
                 is specified in the table's key schema, or a tuple of the partition key and the
                 range key values, if both are specified in the key schema.
-            check_existing: Raise ValueError if the specified key does not exists in the table.
-                Defaults to True to be consistent with python dict implementation, however this
-                causes an additional get_item operation to be executed.
+            check_existing: Raise KeyError if the specified key does not exists in the table.
+                Defaults to True to be consistent with python dict implementation. The check is
+                performed with a condition expression on the delete_item operation. If a custom
+                ``ConditionExpression`` is also passed, the check is performed instead with an
+                additional get_item operation.
             **kwargs: keyword arguments to be passed to the underlying DynamoDB
                 :meth:`~DynamoDBTable.delete_item` operation.
+
+        Raises:
+            ValueError: If the required key values are not specified.
+            KeyError: If ``check_existing`` is True and no item can be found under this key in the
+                table.
         """
         key_params = self._create_key_param(keys)
-        if check_existing and keys not in self.keys():
+        conditional_check = check_existing and "ConditionExpression" not in kwargs
+        if conditional_check:
+            kwargs["ConditionExpression"] = "attribute_exists(#k0)"
+            kwargs["ExpressionAttributeNames"] = {
+                **kwargs.get("ExpressionAttributeNames", {}),
+                "#k0": self._pk_name,
+            }
+        elif check_existing and not self._exists(keys):
             raise KeyError(_log_keys_from_params(key_params))
         logger.debug("Performing a delete_item operation on %s table", self.table.name)
-        self.table.delete_item(Key=key_params, **kwargs)
+        try:
+            self.table.delete_item(Key=key_params, **kwargs)
+        except ClientError as error:
+            if (
+                conditional_check
+                and error.response["Error"]["Code"] == "ConditionalCheckFailedException"
+            ):
+                raise KeyError(_log_keys_from_params(key_params)) from None
+            raise
+
+    def del_many(self, keys: Iterable[DynamoDBKeySimplified]) -> None:
+        """Delete multiple items from the table using as few requests as possible.
+
+        The deletions are buffered and sent in DynamoDB ``BatchWriteItem`` requests of at most 25
+        items each. The requests that DynamoDB does not process are automatically resubmitted.
+        Keys that do not exist in the table are silently ignored.
+
+        Example::
+
+            mapping.del_many(["my_key", "my_other_key"])
+
+        Args:
+            keys: An iterable of key values. Each key value can either be a simple Python type,
+                if only the partition key is specified in the table's key schema, or a tuple of the
+                partition key and the range key values, if both are specified in the key schema.
+        """
+        logger.debug("Performing a batch delete operation on %s table", self.table.name)
+        with self.table.batch_writer(overwrite_by_pkeys=list(self.key_names)) as batch:
+            for k in keys:
+                batch.delete_item(Key=self._create_key_param(k))
 
     def modify_item(
-        self, keys: DynamoDBKeySimplified, modifications: DynamoDBItemType, **kwargs
+        self,
+        keys: DynamoDBKeySimplified,
+        modifications: DynamoDBItemType,
+        expected_version: Optional[int] = None,
+        **kwargs,
     ) -> None:
         """Modify the properties of an existing item.
 
@@ -488,39 +1244,64 @@ class DynamoDBMapping(MutableMapping):
                 the fields of the item. This mapping follows the same format as the entire item, but
                 it isn't required to contain all fields: fields that are omitted will be unaffected.
                 To delete a field, set the field value to None.
+            expected_version: If specified, the item is modified only if its version number,
+                stored in the ``version_attribute`` of the mapping, equals to this value, and the
+                version number is incremented in the same operation. A version number of 0
+                matches items without a version attribute. Can not be combined with a custom
+                ``ConditionExpression``.
             **kwargs: keyword arguments to be passed to the underlying DynamoDB
                 :meth:`~DynamoDBTable.update_item` operation.
+
+        Raises:
+            ValueError: If the required key values are not specified, or if ``expected_version``
+                is used without a ``version_attribute`` on the mapping, together with a
+                ``ConditionExpression`` or with a modification of the version attribute.
+            TypeError: If ``expected_version`` is not an integer number.
+            ConcurrentModificationError: If the version number of the item differs from
+                ``expected_version``.
         """
         key_params = self._create_key_param(keys)
-        set_expression_parts = []
-        remove_expression_parts = []
-        attribute_names = {}
-        attribute_values = {}
-        for idx, (attrib_key, attrib_value) in enumerate(modifications.items()):
-            attrib_key_ph = f"#key{idx}"
-            attrib_value_ph = f":value{idx}"
-            attribute_names[attrib_key_ph] = attrib_key
-            if attrib_value is None:
-                remove_expression_parts.append(attrib_key_ph)
-            else:
-                set_expression_parts.append(f"{attrib_key_ph} = {attrib_value_ph}")
-                attribute_values[attrib_value_ph] = attrib_value
-        update_expression_parts = []
-        if set_expression_parts:
-            update_expression_parts.append("set " + ", ".join(set_expression_parts))
-        if remove_expression_parts:
-            update_expression_parts.append(
-                "remove " + ", ".join(remove_expression_parts)
-            )
-        if not update_expression_parts:
+        versioned = expected_version is not None
+        if not modifications and not versioned:
             warning_msg = (
                 "No update expression was created by modify_item: "
                 "modifications mapping is empty?"
             )
-            warnings.warn(warning_msg, UserWarning)
+            warnings.warn(warning_msg, UserWarning, stacklevel=2)
             logger.warning(warning_msg)
             return
-        update_expression = " ".join(update_expression_parts)
+        if versioned and "ConditionExpression" in kwargs:
+            raise ValueError(
+                "expected_version can not be used together with ConditionExpression."
+            )
+        if versioned:
+            if not self.version_attribute:
+                raise ValueError(
+                    "expected_version requires the version_attribute option."
+                )
+            if isinstance(expected_version, bool) or not isinstance(
+                expected_version, (int, Decimal)
+            ):
+                raise TypeError(
+                    f"The version number must be an integer, not {expected_version!r}."
+                )
+            if self.version_attribute in modifications:
+                raise ValueError(
+                    f"The {self.version_attribute} attribute can not be modified together with "
+                    "expected_version."
+                )
+        attribute_keys = tuple(modifications.keys())
+        modification_values = tuple(modifications.values())
+        attribute_values = {
+            f":value{idx}": attrib_value
+            for idx, attrib_value in enumerate(modification_values)
+            if attrib_value is not None
+        }
+        update_expression, attribute_names = _build_update_template(
+            attribute_keys,
+            tuple(attrib_value is None for attrib_value in modification_values),
+            self.version_attribute if versioned else None,
+        )
         logger.debug(
             "Performing an update_item operation on %s table with update expression %s",
             self.table.name,
@@ -528,17 +1309,42 @@ class DynamoDBMapping(MutableMapping):
         )
         update_item_kwargs = {
             **kwargs,
+            "TableName": self.table.name,
             "Key": key_params,
             "UpdateExpression": update_expression,
         }
+        if versioned:
+            expected_version = cast(int, expected_version)
+            update_item_kwargs["ConditionExpression"] = (
+                "attribute_not_exists(#version) OR #version = :version"
+                if expected_version == 0
+                else "#version = :version"
+            )
+            attribute_values[":version"] = expected_version
+            attribute_values[":next_version"] = expected_version + 1
         if attribute_values:
             update_item_kwargs["ExpressionAttributeValues"] = attribute_values
         if attribute_names:
-            update_item_kwargs["ExpressionAttributeNames"] = attribute_names
-        self.table.update_item(**update_item_kwargs)
-
-    def _key_values_from_item(self, item: DynamoDBItemType) -> DynamoDBKeyAny:
-        return cast(DynamoDBKeyAny, tuple(item[key] for key in self.key_names))
+            update_item_kwargs["ExpressionAttributeNames"] = dict(attribute_names)
+        try:
+            # Sent directly with the client, skipping the request building of the resource action.
+            self._client.update_item(**update_item_kwargs)
+        except ClientError as error:
+            if (
+                versioned
+                and error.response["Error"]["Code"] == "ConditionalCheckFailedException"
+            ):
+                raise ConcurrentModificationError(
+                    f"Item {_log_keys_from_params(key_params)} was modified concurrently."
+                ) from None
+            raise
+
+    def _key_values_from_item_single(self, item: DynamoDBItemType) -> DynamoDBKeyAny:
+        return (cast(DynamoDBKeyPrimitive, item[self._pk_name]),)
+
+    def _key_values_from_item_composite(self, item: DynamoDBItemType) -> DynamoDBKeyAny:
+        hash_key_name, range_key_name = self.key_names
+        return cast(DynamoDBKeyAny, (item[hash_key_name], item[range_key_name]))
 
     def __iter__(self) -> Iterator:
         """Returns an iterator over the table.
@@ -552,14 +1358,14 @@ class DynamoDBMapping(MutableMapping):
                 print(item)
 
         """
-        for item in self.scan(ProjectionExpression=", ".join(self.key_names)):
+        for item in self.scan(**self._key_projection):
             yield simplify_tuple_keys(self._key_values_from_item(item))
 
     def __len__(self) -> int:
         """Returns a best effort estimation of the number of items in the table.
 
-        If you need the precise number of items in the table, you can use
-        ``len(list(mapping.keys()))``. However this later can be a costly operation.
+        If you need the precise number of items in the table, you can use :meth:`exact_len`.
+        However this later can be a costly operation.
 
         Example::
 
@@ -581,6 +1387,19 @@ class DynamoDBMapping(MutableMapping):
         """
         return self.get_item(key)
 
+    def __contains__(self, key: object) -> bool:
+        """Checks if an item exists in the table under the given key.
+
+        Only the partition key attribute of the item is retrieved.
+
+        Example::
+
+            if "my_key" in mapping:
+                print("my_key exists")
+
+        """
+        return self._exists(cast(DynamoDBKeySimplified, key))
+
     def __setitem__(self, key: DynamoDBKeySimplified, value: DynamoDBItemType) -> None:
         """Creates or overwrites a single item in the table.
 
@@ -605,7 +1424,54 @@ class DynamoDBMapping(MutableMapping):
         """
         self.del_item(key)
 
-    def items(self) -> ItemsView:
+    def update(self, other: Any = (), /, **kwargs: DynamoDBItemType) -> None:
+        """Creates or overwrites multiple items in the table.
+
+        Accepts the same arguments as :meth:`dict.update`, and writes the items in batches with
+        the :meth:`set_many` method.
+
+        Example::
+
+            mapping.update({"my_key": {"name": "foo"}, "my_other_key": {"name": "bar"}})
+
+        """
+        if isinstance(other, Mapping):
+            items: Iterable[Tuple[Any, Any]] = other.items()
+        elif hasattr(other, "keys"):
+            items = ((k, other[k]) for k in other.keys())
+        else:
+            items = other
+        self.set_many(itertools.chain(items, kwargs.items()))
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Deletes a single item from the table and returns it.
+
+        The item is deleted and returned by a single delete_item operation, instead of a
+        get_item and a delete_item operation of the default implementation.
+
+        Example::
+
+            item = mapping.pop("my_key")
+            item = mapping.pop("my_other_key", None)
+
+        Raises:
+            KeyError: If no item can be found under this key in the table and no default value
+                was specified.
+
+        Returns:
+            The deleted item, or the default value if no item can be found under this key in the
+            table.
+        """
+        key_params = self._create_key_param(key)
+        logger.debug("Performing a delete_item operation on %s table", self.table.name)
+        response = self.table.delete_item(Key=key_params, ReturnValues="ALL_OLD")
+        if "Attributes" not in response:
+            if default is _MISSING:
+                raise KeyError(_log_keys_from_params(key_params))
+            return default
+        return response["Attributes"]
+
+    def items(self, projection: Optional[Sequence[str]] = None) -> ItemsView:
         """Returns an efficient implementation of the :class:`~collections.abc.ItemsView` on this
         table.
 
@@ -616,12 +1482,20 @@ class DynamoDBMapping(MutableMapping):
             for key, item in mapping.items():
                 print(key, item)
 
+            for key, item in mapping.items(projection=["title"]):
+                print(key, item["title"])
+
+        Args:
+            projection: The optional names of the item attributes to be retrieved. The key
+                attributes of the table are always retrieved. If not specified, all attributes
+                are retrieved.
+
         Returns:
             The items view.
         """
-        return DynamoDBItemsView(self)
+        return DynamoDBItemsView(self, projection)
 
-    def values(self) -> ValuesView:
+    def values(self, projection: Optional[Sequence[str]] = None) -> ValuesView:
         """Returns an efficient implementation of the :class:`~collections.abc.ValuesView` on this
         table.
 
@@ -632,10 +1506,17 @@ class DynamoDBMapping(MutableMapping):
             for item in mapping.values():
                 print(item)
 
+            for item in mapping.values(projection=["title"]):
+                print(item["title"])
+
+        Args:
+            projection: The optional names of the item attributes to be retrieved. If not
+                specified, all attributes are retrieved.
+
         Returns:
             The values view.
         """
-        return DynamoDBValuesView(self)
+        return DynamoDBValuesView(self, projection)
 
     def keys(self) -> KeysView:
         """Returns an efficient implementation of the :class:`~collections.abc.KeysView` on this
@@ -2,11 +2,25 @@
 
 """Tests for `dynamodb_mapping` package."""
 
+import gc
+import threading
+import time
+from decimal import Decimal
+
 import pytest
+from boto3.dynamodb.types import Binary
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
-from dynamodb_mapping import DynamoDBMapping
+from dynamodb_mapping import DynamoDBMapping, ConcurrentModificationError
+from dynamodb_mapping.dynamodb_mapping import (
+    _build_update_template,
+    _resource_cache,
+    _session_cache,
+)
 
 TEST_TABLE_HASH_KEY_NAME = "test_primary_key"
+TEST_TABLE_RANGE_KEY_NAME = "test_sort_key"
 
 TEST_ITEM1_KEY = "first_item"
 TEST_ITEM1 = {TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY, "foo": "bar"}
@@ -17,12 +31,47 @@ TEST_ITEM2 = {TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY, "foo2": "bar2"}
 TEST_ATTRIBUTES = {"foo": "bar"}
 
 
+TEST_HASH_KEY_SCHEMA = [{"AttributeName": TEST_TABLE_HASH_KEY_NAME, "KeyType": "HASH"}]
+TEST_COMPOSITE_KEY_SCHEMA = [
+    *TEST_HASH_KEY_SCHEMA,
+    {"AttributeName": TEST_TABLE_RANGE_KEY_NAME, "KeyType": "RANGE"},
+]
+
+# The attributes of the boto3 Table resource that are used by DynamoDBMapping.
+TABLE_MOCK_SPEC = [
+    "batch_writer",
+    "delete_item",
+    "get_item",
+    "item_count",
+    "key_schema",
+    "meta",
+    "name",
+    "put_item",
+]
+
+
+def _make_table_mock(mocker, key_schema):
+    table = mocker.MagicMock(spec=TABLE_MOCK_SPEC)
+    table.configure_mock(name="table_name", key_schema=key_schema)
+    return table
+
+
+def _make_session_mock(mocker, key_schema=TEST_HASH_KEY_SCHEMA):
+    boto3_session = mocker.MagicMock()
+    boto3_session.resource.return_value.Table.return_value = _make_table_mock(
+        mocker, key_schema
+    )
+    return boto3_session
+
+
 @pytest.fixture
 def mapping(mocker):
-    boto3_session = mocker.MagicMock()
-    boto3_session.resource().Table().key_schema = [
-        {"AttributeName": TEST_TABLE_HASH_KEY_NAME, "KeyType": "HASH"}
-    ]
+    return DynamoDBMapping("table_name", boto3_session=_make_session_mock(mocker))
+
+
+@pytest.fixture
+def composite_mapping(mocker):
+    boto3_session = _make_session_mock(mocker, TEST_COMPOSITE_KEY_SCHEMA)
     return DynamoDBMapping("table_name", boto3_session=boto3_session)
 
 
@@ -30,22 +79,249 @@ def test_init(mapping):
     assert mapping.key_names == (TEST_TABLE_HASH_KEY_NAME,)
 
 
+def test_init_config(mocker):
+    boto3_session = _make_session_mock(mocker)
+    DynamoDBMapping("table_name", boto3_session=boto3_session, max_attempts=3)
+    config = boto3_session.resource.call_args.kwargs["config"]
+    assert config.retries == {"mode": "adaptive", "max_attempts": 3}
+    assert config.max_pool_connections == 50
+    assert config.tcp_keepalive is True
+    DynamoDBMapping(
+        "table_name",
+        boto3_session=boto3_session,
+        config=Config(max_pool_connections=5, read_timeout=10),
+    )
+    config = boto3_session.resource.call_args.kwargs["config"]
+    assert config.max_pool_connections == 5
+    assert config.read_timeout == 10
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+
+
+def test_init_resource_cache(mocker):
+    boto3_session = _make_session_mock(mocker)
+    first = DynamoDBMapping("table_name", boto3_session=boto3_session)
+    second = DynamoDBMapping("other_table_name", boto3_session=boto3_session)
+    assert boto3_session.resource.call_count == 1
+    assert first._client is second._client
+    DynamoDBMapping("table_name", boto3_session=boto3_session, max_attempts=3)
+    assert boto3_session.resource.call_count == 2
+
+
+def test_init_resource_cache_config(mocker):
+    boto3_session = _make_session_mock(mocker)
+    for _ in range(3):
+        DynamoDBMapping(
+            "table_name",
+            boto3_session=boto3_session,
+            config=Config(read_timeout=5, proxies={"https": "proxy:1"}),
+        )
+    assert boto3_session.resource.call_count == 1
+    DynamoDBMapping(
+        "table_name", boto3_session=boto3_session, config=Config(read_timeout=6)
+    )
+    assert boto3_session.resource.call_count == 2
+
+
+def test_init_resource_cache_unhashable_config(mocker):
+    boto3_session = _make_session_mock(mocker)
+    for _ in range(2):
+        DynamoDBMapping(
+            "table_name",
+            boto3_session=boto3_session,
+            config=Config(proxies_config={"proxy_client_cert": {"cert.pem"}}),
+        )
+    assert boto3_session.resource.call_count == 2
+    assert not _resource_cache.get(boto3_session)
+    DynamoDBMapping("table_name", boto3_session=boto3_session, config=Config())
+    DynamoDBMapping("table_name", boto3_session=boto3_session)
+    assert boto3_session.resource.call_count == 3
+
+
+def _make_detached_session_mock(mocker):
+    # The resource is not a child of the session mock, so that it does not keep the session alive.
+    boto3_session = mocker.MagicMock()
+    resource = mocker.MagicMock()
+    resource.Table.return_value = _make_table_mock(mocker, TEST_HASH_KEY_SCHEMA)
+    boto3_session.resource.side_effect = lambda *args, **kwargs: resource
+    return boto3_session
+
+
+def test_init_session_cache(mocker):
+    session_cls = mocker.patch(
+        "dynamodb_mapping.dynamodb_mapping.boto3.Session",
+        side_effect=lambda **kwargs: _make_detached_session_mock(mocker),
+    )
+    credentials = {
+        "aws_access_key_id": "key_id",
+        "aws_secret_access_key": "secret",
+        "aws_region": "eu-west-1",
+    }
+    first = DynamoDBMapping("table_name", **credentials)
+    second = DynamoDBMapping("other_table_name", **credentials)
+    assert session_cls.call_count == 1
+    assert first._client is second._client
+    assert all("secret" not in key for key in _session_cache.keys())
+    del first, second
+    gc.collect()
+    assert len(_session_cache) == 0
+    DynamoDBMapping("table_name", **credentials)
+    assert session_cls.call_count == 2
+
+
+def test_consistent_read(mapping, mocker):
+    mapping.consistent_read = True
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    mapping.get_item(TEST_ITEM1_KEY)
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}, ConsistentRead=True
+    )
+    mapping.get_item(TEST_ITEM1_KEY, ConsistentRead=False)
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}, ConsistentRead=False
+    )
+
+
 def test_scan(mapping, mocker):
-    mapping.table.scan = mocker.MagicMock(return_value={"Items": [TEST_ITEM1]})
+    paginate = mocker.MagicMock(return_value=[{"Items": [TEST_ITEM1]}])
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
     assert next(mapping.scan()) == TEST_ITEM1
+    mapping.table.meta.client.get_paginator.assert_called_with("scan")
+    paginate.assert_called_with(TableName="table_name", PaginationConfig={})
 
 
 def test_scan_pages(mapping, mocker):
-    mapping.table.scan = mocker.MagicMock(
-        side_effect=[
+    paginate = mocker.MagicMock(
+        return_value=[
             {"Items": [TEST_ITEM1], "LastEvaluatedKey": "to_be_continued"},
             {"Items": [TEST_ITEM2]},
         ]
     )
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
     results = mapping.scan()
     assert next(results) == TEST_ITEM1
     assert next(results) == TEST_ITEM2
-    assert mapping.table.scan.call_count == 2
+    assert paginate.call_count == 1
+
+
+def test_scan_max_items(mapping, mocker):
+    pages = iter(
+        [
+            {"Items": [TEST_ITEM1, TEST_ITEM2], "LastEvaluatedKey": "to_be_continued"},
+            {"Items": [TEST_ITEM1, TEST_ITEM2], "LastEvaluatedKey": "to_be_continued"},
+            {"Items": [TEST_ITEM1]},
+        ]
+    )
+    paginate = mocker.MagicMock(return_value=pages)
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    assert list(mapping.scan(max_items=3)) == [TEST_ITEM1, TEST_ITEM2, TEST_ITEM1]
+    paginate.assert_called_with(
+        TableName="table_name", PaginationConfig={"PageSize": 3}
+    )
+    assert next(pages) == {"Items": [TEST_ITEM1]}
+    paginate.return_value = [{"Items": [TEST_ITEM1]}, {"Items": [TEST_ITEM2]}]
+    items = mapping.scan(max_items=1, FilterExpression="#a = :v")
+    assert list(items) == [TEST_ITEM1]
+    paginate.assert_called_with(
+        TableName="table_name", PaginationConfig={}, FilterExpression="#a = :v"
+    )
+    with pytest.raises(ValueError):
+        next(mapping.scan(max_items=0))
+
+
+def test_scan_pages_kwargs(mapping, mocker):
+    paginate = mocker.MagicMock(return_value=[{"Items": [TEST_ITEM1]}])
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    assert list(mapping.scan(page_size=10, Select="ALL_ATTRIBUTES")) == [TEST_ITEM1]
+    paginate.assert_called_with(
+        TableName="table_name",
+        PaginationConfig={"PageSize": 10},
+        Select="ALL_ATTRIBUTES",
+    )
+
+
+def test_scan_prefetch(mapping, mocker):
+    pages = [
+        {"Items": [TEST_ITEM1], "LastEvaluatedKey": "to_be_continued"},
+        {"Items": [TEST_ITEM2]},
+    ]
+    paginate = mocker.MagicMock(return_value=pages)
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    assert list(mapping.scan(prefetch=True)) == [TEST_ITEM1, TEST_ITEM2]
+
+
+def test_scan_prefetch_overlap(mapping, mocker):
+    second_page_requested = threading.Event()
+
+    def pages(**kwargs):
+        yield {"Items": [TEST_ITEM1], "LastEvaluatedKey": "to_be_continued"}
+        second_page_requested.set()
+        yield {"Items": [TEST_ITEM2]}
+
+    paginate = mocker.MagicMock(side_effect=pages)
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    results = mapping.scan(prefetch=True)
+    assert next(results) == TEST_ITEM1
+    # The second page is requested while the first one is still being consumed.
+    assert second_page_requested.wait(timeout=5)
+    assert next(results) == TEST_ITEM2
+
+
+def test_scan_parallel(mapping, mocker):
+    def scan_segment(TableName, PaginationConfig, Segment, TotalSegments):
+        return [{"Items": [[TEST_ITEM1, TEST_ITEM2][Segment]]}]
+
+    paginate = mocker.MagicMock(side_effect=scan_segment)
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    items = list(mapping.scan(parallel=2))
+    assert sorted(items, key=lambda i: i[TEST_TABLE_HASH_KEY_NAME]) == [
+        TEST_ITEM1,
+        TEST_ITEM2,
+    ]
+    assert paginate.call_count == 2
+
+
+def test_scan_segmented(mapping, mocker):
+    paginate = mocker.MagicMock(return_value=[{"Items": []}])
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    assert list(mapping.scan(parallel=4)) == []
+    assert paginate.call_count == 4
+    assert sorted(c.kwargs["Segment"] for c in paginate.call_args_list) == [0, 1, 2, 3]
+    assert all(c.kwargs["TotalSegments"] == 4 for c in paginate.call_args_list)
+    with pytest.raises(ValueError):
+        next(mapping.scan(parallel=4, Segment=0, TotalSegments=4))
+
+
+def test_scan_parallel_error(mapping, mocker):
+    paginate = mocker.MagicMock(side_effect=RuntimeError("scan failed"))
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    with pytest.raises(RuntimeError):
+        list(mapping.scan(parallel=2))
+
+
+def test_scan_parallel_close(mapping, mocker):
+    fetched = []
+
+    def scan_segment(TableName, PaginationConfig, Segment, TotalSegments):
+        for _ in range(100):
+            fetched.append(Segment)
+            yield {"Items": [TEST_ITEM1]}
+
+    paginate = mocker.MagicMock(side_effect=scan_segment)
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    items = mapping.scan(parallel=4)
+    next(items)
+    # One page consumed, eight pages in the queue and four pages waiting to be put.
+    for _ in range(200):
+        if len(fetched) == 13:
+            break
+        time.sleep(0.01)
+    items.close()
+    assert len(fetched) == 13
+
+
+def test_scan_parallel_invalid(mapping):
+    with pytest.raises(ValueError):
+        next(mapping.scan(parallel=0))
 
 
 def test_get_item(mapping, mocker):
@@ -56,11 +332,41 @@ def test_get_item(mapping, mocker):
     )
 
 
+def test_get_item_tuple_key(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    assert mapping.get_item((TEST_ITEM1_KEY,)) == TEST_ITEM1
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}
+    )
+
+
+def test_get_item_single_key_fast_path(mapping, mocker):
+    create_tuple_keys = mocker.patch(
+        "dynamodb_mapping.dynamodb_mapping.create_tuple_keys"
+    )
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    for key in (TEST_ITEM1_KEY, 42, b"binary"):
+        mapping.get_item(key)
+        mapping.table.get_item.assert_called_with(Key={TEST_TABLE_HASH_KEY_NAME: key})
+    create_tuple_keys.assert_not_called()
+
+
 def test_invalid_keys(mapping):
     with pytest.raises(ValueError):
         mapping.get_item((TEST_ITEM1_KEY, TEST_ITEM2_KEY))
 
 
+def test_get_item_composite(composite_mapping, mocker):
+    get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    composite_mapping.table.get_item = get_item
+    assert composite_mapping.get_item((TEST_ITEM1_KEY, 1)) == TEST_ITEM1
+    get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY, TEST_TABLE_RANGE_KEY_NAME: 1}
+    )
+    with pytest.raises(ValueError):
+        composite_mapping.get_item(TEST_ITEM1_KEY)
+
+
 def test_get_item_non_existing(mapping, mocker):
     mapping.table.get_item = mocker.MagicMock(return_value={})
     with pytest.raises(KeyError):
@@ -78,6 +384,88 @@ def test_get_item_accessor(mapping, mocker):
     mapping.modify_item.assert_called_with(TEST_ITEM1_KEY, {"new_attrib": "foobar"})
 
 
+def test_get_item_accessor_delete(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(
+        return_value={"Item": {**TEST_ITEM1, "internal": 1}}
+    )
+    mapping.modify_item = mocker.MagicMock()
+    accessor = mapping.get_item(TEST_ITEM1_KEY)
+    del accessor["internal"]
+    assert accessor == TEST_ITEM1
+    mapping.modify_item.assert_not_called()
+
+
+def test_slots(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    for obj in [
+        mapping.get_item(TEST_ITEM1_KEY),
+        mapping.keys(),
+        mapping.values(),
+        mapping.items(),
+    ]:
+        assert not hasattr(obj, "__dict__")
+
+
+def test_get_item_accessor_versioned(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.get_item = mocker.MagicMock(
+        return_value={"Item": {**TEST_ITEM1, "_version": 3}}
+    )
+    mapping.modify_item = mocker.MagicMock()
+    accessor = mapping.get_item(TEST_ITEM1_KEY)
+    accessor["new_attrib"] = "foobar"
+    mapping.modify_item.assert_called_with(
+        TEST_ITEM1_KEY, {"new_attrib": "foobar"}, expected_version=3
+    )
+    accessor["new_attrib"] = "barfoo"
+    mapping.modify_item.assert_called_with(
+        TEST_ITEM1_KEY, {"new_attrib": "barfoo"}, expected_version=4
+    )
+    assert accessor["_version"] == 5
+
+
+def test_get_item_accessor_versioned_without_version(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    accessor = mapping.get_item(TEST_ITEM1_KEY)
+    accessor["new_attrib"] = "foobar"
+    kwargs = mapping._client.update_item.call_args.kwargs
+    assert (
+        kwargs["ConditionExpression"]
+        == "attribute_not_exists(#version) OR #version = :version"
+    )
+    assert kwargs["ExpressionAttributeValues"][":version"] == 0
+    assert accessor["_version"] == 1
+
+
+def test_get_item_accessor_versioned_projection(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    mapping.modify_item = mocker.MagicMock()
+    accessor = mapping.get_item(TEST_ITEM1_KEY, ProjectionExpression="foo")
+    accessor["new_attrib"] = "foobar"
+    mapping.modify_item.assert_called_with(TEST_ITEM1_KEY, {"new_attrib": "foobar"})
+
+
+def test_get_many_versioned_projection(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.meta.client.batch_get_item = mocker.MagicMock(
+        return_value={"Responses": {"table_name": [{**TEST_ITEM1, "_version": 7}]}}
+    )
+    mapping.modify_item = mocker.MagicMock()
+    (accessor,) = mapping.get_many([TEST_ITEM1_KEY], projection=["foo"])
+    request = mapping.table.meta.client.batch_get_item.call_args.kwargs
+    assert request["RequestItems"]["table_name"]["ExpressionAttributeNames"] == {
+        "#p0": TEST_TABLE_HASH_KEY_NAME,
+        "#p1": "foo",
+        "#p2": "_version",
+    }
+    accessor["new_attrib"] = "foobar"
+    mapping.modify_item.assert_called_with(
+        TEST_ITEM1_KEY, {"new_attrib": "foobar"}, expected_version=7
+    )
+
+
 def test_set_item(mapping, mocker):
     mapping.table.put_item = mocker.MagicMock()
     mapping.set_item(TEST_ITEM1_KEY, TEST_ATTRIBUTES)
@@ -86,12 +474,42 @@ def test_set_item(mapping, mocker):
     )
 
 
+def test_set_item_key_override(mapping, mocker):
+    mapping.table.put_item = mocker.MagicMock()
+    mapping.set_item(TEST_ITEM1_KEY, TEST_ITEM2)
+    mapping.table.put_item.assert_called_with(
+        Item={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY, "foo2": "bar2"}
+    )
+
+
 def test_put_item(mapping, mocker):
     mapping.set_item = mocker.MagicMock()
     mapping.put_item(TEST_ITEM1_KEY, TEST_ATTRIBUTES)
     mapping.set_item.assert_called_with(TEST_ITEM1_KEY, TEST_ATTRIBUTES)
 
 
+def test_set_many(mapping, mocker):
+    batch = mapping.table.batch_writer.return_value.__enter__.return_value
+    mapping.set_many([(TEST_ITEM1_KEY, TEST_ATTRIBUTES), (TEST_ITEM2_KEY, {})])
+    mapping.table.batch_writer.assert_called_once_with(
+        overwrite_by_pkeys=[TEST_TABLE_HASH_KEY_NAME]
+    )
+    assert batch.put_item.call_args_list == [
+        mocker.call(Item={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY, **TEST_ATTRIBUTES}),
+        mocker.call(Item={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY}),
+    ]
+
+
+def test_batch_set(mapping, mocker):
+    batch = mapping.table.batch_writer.return_value.__enter__.return_value
+    mapping.update({TEST_ITEM1_KEY: TEST_ATTRIBUTES}, second_item={})
+    mapping.table.batch_writer.assert_called_once()
+    assert batch.put_item.call_args_list == [
+        mocker.call(Item={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY, **TEST_ATTRIBUTES}),
+        mocker.call(Item={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY}),
+    ]
+
+
 def test_del_item(mapping, mocker):
     mapping.table.delete_item = mocker.MagicMock()
     mapping.del_item(TEST_ITEM1_KEY, check_existing=False)
@@ -100,19 +518,57 @@ def test_del_item(mapping, mocker):
     )
 
 
-def test_del_item_non_existing(mapping, mocker):
+def test_del_item_check_existing(mapping, mocker):
     mapping.table.delete_item = mocker.MagicMock()
-    mapping.keys = mocker.MagicMock(return_value=[TEST_ITEM2_KEY])
+    mapping.del_item(TEST_ITEM1_KEY)
+    mapping.table.delete_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        ConditionExpression="attribute_exists(#k0)",
+        ExpressionAttributeNames={"#k0": TEST_TABLE_HASH_KEY_NAME},
+    )
+
+
+def test_del_item_non_existing(mapping, mocker):
+    error = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "DeleteItem"
+    )
+    mapping.table.delete_item = mocker.MagicMock(side_effect=error)
     with pytest.raises(KeyError):
         mapping.del_item(TEST_ITEM1_KEY)
 
 
+def test_del_many(mapping, mocker):
+    batch = mapping.table.batch_writer.return_value.__enter__.return_value
+    mapping.del_many([TEST_ITEM1_KEY, TEST_ITEM2_KEY])
+    mapping.table.batch_writer.assert_called_once_with(
+        overwrite_by_pkeys=[TEST_TABLE_HASH_KEY_NAME]
+    )
+    assert batch.delete_item.call_args_list == [
+        mocker.call(Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}),
+        mocker.call(Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY}),
+    ]
+
+
+def test_del_item_custom_condition(mapping, mocker):
+    mapping.table.delete_item = mocker.MagicMock()
+    mapping.table.get_item = mocker.MagicMock(side_effect=[{"Item": TEST_ITEM1}, {}])
+    mapping.del_item(TEST_ITEM1_KEY, ConditionExpression="foo = :bar")
+    mapping.table.delete_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        ConditionExpression="foo = :bar",
+    )
+    with pytest.raises(KeyError):
+        mapping.del_item(TEST_ITEM1_KEY, ConditionExpression="foo = :bar")
+    assert mapping.table.delete_item.call_count == 1
+
+
 def test_modify_item(mapping, mocker):
-    mapping.table.update_item = mocker.MagicMock()
+    mapping.table.meta.client.update_item = mocker.MagicMock()
     mapping.modify_item(
         TEST_ITEM1_KEY, {"new1": "foobar!", "new2": "bar_foo!", "zombie": None}
     )
-    mapping.table.update_item.assert_called_with(
+    mapping.table.meta.client.update_item.assert_called_with(
+        TableName="table_name",
         Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
         UpdateExpression="set #key0 = :value0, #key1 = :value1 remove #key2",
         ExpressionAttributeValues={":value0": "foobar!", ":value1": "bar_foo!"},
@@ -120,9 +576,132 @@ def test_modify_item(mapping, mocker):
     )
 
 
-def test_modify_empty(mapping):
-    with pytest.warns(UserWarning):
+def test_modify_item_remove_first(mapping, mocker):
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    for _ in range(2):
+        mapping.modify_item(TEST_ITEM1_KEY, {"zombie": None, "new1": "foobar!"})
+        mapping.table.meta.client.update_item.assert_called_with(
+            TableName="table_name",
+            Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+            UpdateExpression="set #key1 = :value1 remove #key0",
+            ExpressionAttributeValues={":value1": "foobar!"},
+            ExpressionAttributeNames={"#key0": "zombie", "#key1": "new1"},
+        )
+
+
+def test_modify_item_cached_template(mapping, mocker):
+    update_item = mapping.table.meta.client.update_item = mocker.MagicMock()
+    cache_info = _build_update_template.cache_info
+    mapping.modify_item(TEST_ITEM1_KEY, {"new1": "foobar!", "zombie": None})
+    hits = cache_info().hits
+    update_item.call_args.kwargs["ExpressionAttributeNames"]["#key0"] = "mutated"
+    mapping.modify_item(TEST_ITEM1_KEY, {"new1": "barfoo!", "zombie": None})
+    assert cache_info().hits == hits + 1
+    update_item.assert_called_with(
+        TableName="table_name",
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        UpdateExpression="set #key0 = :value0 remove #key1",
+        ExpressionAttributeValues={":value0": "barfoo!"},
+        ExpressionAttributeNames={"#key0": "new1", "#key1": "zombie"},
+    )
+
+
+def test_modify_item_many_attributes(mapping, mocker):
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    modifications = {f"attr{idx}": None if idx % 2 else idx for idx in range(300)}
+    mapping.modify_item(TEST_ITEM1_KEY, modifications)
+    kwargs = mapping.table.meta.client.update_item.call_args.kwargs
+    set_clause, remove_clause = kwargs["UpdateExpression"].split(" remove ")
+    assert set_clause == "set " + ", ".join(
+        f"#key{idx} = :value{idx}" for idx in range(0, 300, 2)
+    )
+    assert remove_clause == ", ".join(f"#key{idx}" for idx in range(1, 300, 2))
+    assert len(kwargs["ExpressionAttributeNames"]) == 300
+    assert len(kwargs["ExpressionAttributeValues"]) == 150
+
+
+def test_modify_item_versioned(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    mapping.modify_item(TEST_ITEM1_KEY, {"new1": "foobar!"}, expected_version=1)
+    mapping.table.meta.client.update_item.assert_called_with(
+        TableName="table_name",
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        UpdateExpression="set #key0 = :value0, #version = :next_version",
+        ConditionExpression="#version = :version",
+        ExpressionAttributeValues={
+            ":value0": "foobar!",
+            ":version": 1,
+            ":next_version": 2,
+        },
+        ExpressionAttributeNames={"#key0": "new1", "#version": "_version"},
+    )
+
+
+def test_modify_item_versioned_version_attribute(mapping, mocker):
+    mapping.version_attribute = "_version"
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    with pytest.raises(ValueError):
+        mapping.modify_item(TEST_ITEM1_KEY, {"_version": 7}, expected_version=1)
+    mapping.table.get_item = mocker.MagicMock(
+        return_value={"Item": {**TEST_ITEM1, "_version": 3}}
+    )
+    accessor = mapping.get_item(TEST_ITEM1_KEY)
+    with pytest.raises(ValueError):
+        accessor["_version"] = 4
+    assert accessor["_version"] == 3
+    mapping.table.meta.client.update_item.assert_not_called()
+
+
+def test_modify_item_versioning_disabled(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(
+        return_value={"Item": {**TEST_ITEM1, "_version": "schema-v2"}}
+    )
+    mapping.modify_item = mocker.MagicMock()
+    accessor = mapping.get_item(TEST_ITEM1_KEY)
+    accessor["new_attrib"] = "foobar"
+    mapping.modify_item.assert_called_with(TEST_ITEM1_KEY, {"new_attrib": "foobar"})
+    assert accessor["_version"] == "schema-v2"
+
+
+def test_modify_item_invalid_expected_version(mapping, mocker):
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    with pytest.raises(ValueError):
+        mapping.modify_item(TEST_ITEM1_KEY, {"new1": "foobar!"}, expected_version=1)
+    mapping.version_attribute = "_version"
+    for expected_version in ("schema-v2", True, 1.0):
+        with pytest.raises(TypeError):
+            mapping.modify_item(
+                TEST_ITEM1_KEY, {"new1": "foobar!"}, expected_version=expected_version
+            )
+    mapping.table.meta.client.update_item.assert_not_called()
+    mapping.modify_item(
+        TEST_ITEM1_KEY, {"new1": "foobar!"}, expected_version=Decimal(2)
+    )
+    kwargs = mapping.table.meta.client.update_item.call_args.kwargs
+    assert kwargs["ExpressionAttributeValues"][":next_version"] == 3
+
+
+def test_modify_item_concurrent(mapping, mocker):
+    mapping.version_attribute = "_version"
+    error = ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException"}}, "UpdateItem"
+    )
+    mapping.table.meta.client.update_item = mocker.MagicMock(side_effect=error)
+    with pytest.raises(ConcurrentModificationError):
+        mapping.modify_item(TEST_ITEM1_KEY, {"new1": "foobar!"}, expected_version=0)
+    assert (
+        mapping.table.meta.client.update_item.call_args.kwargs["ConditionExpression"]
+        == "attribute_not_exists(#version) OR #version = :version"
+    )
+
+
+def test_modify_empty(mapping, mocker):
+    mapping.table.meta.client.update_item = mocker.MagicMock()
+    with pytest.warns(UserWarning) as record:
         mapping.modify_item(TEST_ITEM1_KEY, {})
+    assert record[0].filename == __file__
+    mapping.table.meta.client.update_item.assert_not_called()
 
 
 def test_op_iter(mapping, mocker):
@@ -133,7 +712,11 @@ def test_op_iter(mapping, mocker):
         ]
     )
     assert list(mapping) == [TEST_ITEM1_KEY, TEST_ITEM2_KEY]
-    mapping.scan.assert_called_with(ProjectionExpression=TEST_TABLE_HASH_KEY_NAME)
+    mapping.scan.assert_called_with(
+        ProjectionExpression="#p0",
+        ExpressionAttributeNames={"#p0": TEST_TABLE_HASH_KEY_NAME},
+        Select="SPECIFIC_ATTRIBUTES",
+    )
 
 
 def test_op_len(mapping):
@@ -141,6 +724,36 @@ def test_op_len(mapping):
     assert len(mapping) == 42
 
 
+def test_exact_len(mapping, mocker):
+    paginate = mocker.MagicMock(
+        return_value=[
+            {"Count": 2, "ScannedCount": 2, "LastEvaluatedKey": "to_be_continued"},
+            {"Count": 1, "ScannedCount": 1},
+        ]
+    )
+    mapping.table.meta.client.get_paginator.return_value.paginate = paginate
+    assert mapping.exact_len() == 3
+    paginate.assert_called_with(
+        TableName="table_name", PaginationConfig={}, Select="COUNT"
+    )
+
+
+def test_count_exact(mapping, mocker):
+    pages = [mocker.MagicMock(), mocker.MagicMock()]
+    pages[0].__getitem__.side_effect = {"Count": 5, "ScannedCount": 5}.__getitem__
+    pages[1].__getitem__.side_effect = {"Count": 2, "ScannedCount": 3}.__getitem__
+    paginate = mapping.table.meta.client.get_paginator.return_value.paginate
+    paginate.return_value = pages
+    mapping.table.item_count = 42
+    assert mapping.count() == 42
+    paginate.assert_not_called()
+    assert mapping.count(exact=True) == 7
+    for page in pages:
+        assert mocker.call("Items") not in page.__getitem__.call_args_list
+    with pytest.raises(ValueError):
+        mapping.count(parallel=2)
+
+
 def test_op_getitem(mapping, mocker):
     mapping.get_item = mocker.MagicMock(return_value=TEST_ITEM1)
     assert mapping[TEST_ITEM1_KEY] == TEST_ITEM1
@@ -159,27 +772,273 @@ def test_op_delitem(mapping, mocker):
     mapping.del_item.assert_called_with(TEST_ITEM1_KEY)
 
 
+def test_pop(mapping, mocker):
+    mapping.table.delete_item = mocker.MagicMock(
+        side_effect=[{"Attributes": TEST_ITEM1}, {}, {}]
+    )
+    assert mapping.pop(TEST_ITEM1_KEY) == TEST_ITEM1
+    mapping.table.delete_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}, ReturnValues="ALL_OLD"
+    )
+    assert mapping.pop(TEST_ITEM2_KEY, None) is None
+    with pytest.raises(KeyError):
+        mapping.pop(TEST_ITEM2_KEY)
+
+
 def test_items_view(mapping, mocker):
     mapping.scan = mocker.MagicMock(return_value=[TEST_ITEM1, TEST_ITEM2])
     items = mapping.items()
     assert list(items) == [(TEST_ITEM1_KEY, TEST_ITEM1), (TEST_ITEM2_KEY, TEST_ITEM2)]
 
 
+def test_items_view_projection(mapping, mocker):
+    mapping.scan = mocker.MagicMock(return_value=[TEST_ITEM1])
+    items = mapping.items(projection=["foo"])
+    assert list(items) == [(TEST_ITEM1_KEY, TEST_ITEM1)]
+    mapping.scan.assert_called_with(
+        ProjectionExpression="#p0, #p1",
+        ExpressionAttributeNames={"#p0": TEST_TABLE_HASH_KEY_NAME, "#p1": "foo"},
+    )
+
+
+def test_items_view_contains(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(side_effect=[{"Item": TEST_ITEM1}, {}])
+    items = mapping.items()
+    assert (TEST_ITEM1_KEY, TEST_ITEM1) in items
+    assert (TEST_ITEM2_KEY, TEST_ITEM2) not in items
+
+
+def test_items_view_composite(composite_mapping, mocker):
+    item = {**TEST_ITEM1, TEST_TABLE_RANGE_KEY_NAME: 1}
+    composite_mapping.scan = mocker.MagicMock(return_value=[item])
+    assert list(composite_mapping.items()) == [((TEST_ITEM1_KEY, 1), item)]
+
+
 def test_values_view(mapping, mocker):
     mapping.scan = mocker.MagicMock(return_value=[TEST_ITEM1])
+    mapping.table.get_item = mocker.MagicMock(side_effect=[{"Item": TEST_ITEM1}, {}])
     values = mapping.values()
     assert TEST_ITEM1 in values
     assert TEST_ITEM2 not in values
     assert list(values) == [TEST_ITEM1]
 
 
+def test_values_view_contains_key_lookup(mapping, mocker):
+    mapping.scan = mocker.MagicMock()
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": TEST_ITEM1})
+    assert TEST_ITEM1 in mapping.values()
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}
+    )
+    assert {**TEST_ITEM1, "foo": "other"} not in mapping.values()
+    assert TEST_ITEM1 in mapping.values(projection=[TEST_TABLE_HASH_KEY_NAME, "foo"])
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        ProjectionExpression="#p0, #p1",
+        ExpressionAttributeNames={"#p0": TEST_TABLE_HASH_KEY_NAME, "#p1": "foo"},
+    )
+    mapping.scan.assert_not_called()
+
+
+def test_values_view_contains_invalid_key(mapping, mocker):
+    mapping.scan = mocker.MagicMock()
+    mapping.table.get_item = mocker.MagicMock(
+        side_effect=ClientError(
+            {"Error": {"Code": "ValidationException", "Message": "Type mismatch"}},
+            "GetItem",
+        )
+    )
+    assert {TEST_TABLE_HASH_KEY_NAME: ""} not in mapping.values()
+    mapping.scan.assert_not_called()
+    mapping.table.get_item.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "No table"}},
+        "GetItem",
+    )
+    with pytest.raises(ClientError):
+        TEST_ITEM1 in mapping.values()
+
+
+def test_values_view_contains_binary_key(mapping, mocker):
+    item = {TEST_TABLE_HASH_KEY_NAME: Binary(b"key"), "foo": "bar"}
+    mapping.scan = mocker.MagicMock()
+    mapping.table.get_item = mocker.MagicMock(return_value={"Item": item})
+    assert item in mapping.values()
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: Binary(b"key")}
+    )
+    mapping.scan.assert_not_called()
+
+
+def test_values_view_contains_unsendable_key(mapping, mocker):
+    mapping.scan = mocker.MagicMock(
+        return_value=[{TEST_TABLE_HASH_KEY_NAME: Decimal(1), "foo": "bar"}]
+    )
+    mapping.table.get_item = mocker.MagicMock()
+    assert {TEST_TABLE_HASH_KEY_NAME: 1.0, "foo": "bar"} in mapping.values()
+    mapping.scan.assert_called_with()
+    mapping.table.get_item.assert_not_called()
+
+
+def test_values_view_contains_filter(mapping, mocker):
+    mapping.scan = mocker.MagicMock(return_value=[TEST_ITEM1])
+    assert {"foo": "bar"} not in mapping.values()
+    mapping.scan.assert_not_called()
+    assert {TEST_TABLE_HASH_KEY_NAME: {"not": "a key"}} not in mapping.values()
+    mapping.scan.assert_called_with(
+        FilterExpression="#f0 = :f0",
+        ExpressionAttributeNames={"#f0": TEST_TABLE_HASH_KEY_NAME},
+        ExpressionAttributeValues={":f0": {"not": "a key"}},
+    )
+    assert {"foo": "bar"} not in mapping.values(projection=["foo"])
+    mapping.scan.assert_called_with(
+        ProjectionExpression="#p0",
+        FilterExpression="#f0 = :f0",
+        ExpressionAttributeNames={"#p0": "foo", "#f0": "foo"},
+        ExpressionAttributeValues={":f0": "bar"},
+    )
+    assert "not a mapping" not in mapping.values()
+    mapping.scan.assert_called_with()
+
+
+def test_values_view_contains_unserializable(mapping, mocker):
+    mapping.scan = mocker.MagicMock(
+        return_value=[{"price": Decimal("1.5"), "tags": set()}]
+    )
+    values = mapping.values(projection=["price", "tags"])
+    projection_kwargs = {
+        "ProjectionExpression": "#p0, #p1",
+        "ExpressionAttributeNames": {"#p0": "price", "#p1": "tags"},
+    }
+    assert {"price": 1.5, "tags": set()} in values
+    mapping.scan.assert_called_with(**projection_kwargs)
+    assert {"price": 1.5} not in values
+    assert {"tags": {"nested": set()}} not in values
+    mapping.scan.assert_called_with(**projection_kwargs)
+
+
+def test_values_view_projection(mapping, mocker):
+    mapping.scan = mocker.MagicMock(return_value=[{"foo": "bar"}])
+    values = mapping.values(projection=["foo"])
+    assert list(values) == [{"foo": "bar"}]
+    mapping.scan.assert_called_with(
+        ProjectionExpression="#p0", ExpressionAttributeNames={"#p0": "foo"}
+    )
+
+
 def test_keys_view(mapping, mocker):
     mapping.table.get_item = mocker.MagicMock(side_effect=[{"Item": TEST_ITEM1}])
     keys = mapping.keys()
     assert TEST_ITEM1_KEY in keys
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        ProjectionExpression="#k0",
+        ExpressionAttributeNames={"#k0": TEST_TABLE_HASH_KEY_NAME},
+    )
 
 
 def test_keys_view_non_existing(mapping, mocker):
     mapping.table.get_item = mocker.MagicMock(side_effect=[{}])
     keys = mapping.keys()
     assert TEST_ITEM1_KEY not in keys
+
+
+def test_op_contains(mapping, mocker):
+    mapping.table.get_item = mocker.MagicMock(side_effect=[{"Item": TEST_ITEM1}, {}])
+    assert TEST_ITEM1_KEY in mapping
+    mapping.table.get_item.assert_called_with(
+        Key={TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+        ProjectionExpression="#k0",
+        ExpressionAttributeNames={"#k0": TEST_TABLE_HASH_KEY_NAME},
+    )
+    assert TEST_ITEM2_KEY not in mapping
+
+
+def test_get_many(mapping, mocker):
+    batch_get_item = mocker.MagicMock(
+        return_value={"Responses": {"table_name": [TEST_ITEM1, TEST_ITEM2]}}
+    )
+    mapping.table.meta.client.batch_get_item = batch_get_item
+    items = list(mapping.get_many([TEST_ITEM1_KEY, TEST_ITEM2_KEY]))
+    assert items == [TEST_ITEM1, TEST_ITEM2]
+    batch_get_item.assert_called_once_with(
+        RequestItems={
+            "table_name": {
+                "Keys": [
+                    {TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY},
+                    {TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY},
+                ]
+            }
+        }
+    )
+
+
+def test_batch_get(mapping, mocker):
+    mapping.table.meta.client.batch_get_item = mocker.MagicMock(
+        return_value={"Responses": {"table_name": [TEST_ITEM1]}, "UnprocessedKeys": {}}
+    )
+    items = list(
+        mapping.get_many([TEST_ITEM1_KEY, TEST_ITEM1_KEY], ConsistentRead=True)
+    )
+    assert items == [TEST_ITEM1]
+    mapping.table.meta.client.batch_get_item.assert_called_with(
+        RequestItems={
+            "table_name": {
+                "Keys": [{TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}],
+                "ConsistentRead": True,
+            }
+        }
+    )
+
+
+def test_get_many_projection(mapping, mocker):
+    mapping.table.meta.client.batch_get_item = mocker.MagicMock(
+        return_value={"Responses": {"table_name": [TEST_ITEM1]}}
+    )
+    items = list(mapping.get_many([TEST_ITEM1_KEY], projection=["foo"]))
+    assert items == [TEST_ITEM1]
+    mapping.table.meta.client.batch_get_item.assert_called_with(
+        RequestItems={
+            "table_name": {
+                "Keys": [{TEST_TABLE_HASH_KEY_NAME: TEST_ITEM1_KEY}],
+                "ProjectionExpression": "#p0, #p1",
+                "ExpressionAttributeNames": {
+                    "#p0": TEST_TABLE_HASH_KEY_NAME,
+                    "#p1": "foo",
+                },
+            }
+        }
+    )
+    with pytest.raises(ValueError):
+        list(mapping.get_many([TEST_ITEM1_KEY], ProjectionExpression="foo"))
+
+
+def test_get_many_unprocessed(mapping, mocker):
+    sleep = mocker.patch("dynamodb_mapping.dynamodb_mapping.time.sleep")
+    unprocessed_key = {TEST_TABLE_HASH_KEY_NAME: TEST_ITEM2_KEY}
+    mapping.table.meta.client.batch_get_item = mocker.MagicMock(
+        side_effect=[
+            {
+                "Responses": {"table_name": [TEST_ITEM1]},
+                "UnprocessedKeys": {"table_name": {"Keys": [unprocessed_key]}},
+            },
+            {"Responses": {"table_name": [TEST_ITEM2]}, "UnprocessedKeys": {}},
+        ]
+    )
+    items = list(mapping.get_many([TEST_ITEM1_KEY, TEST_ITEM2_KEY]))
+    assert items == [TEST_ITEM1, TEST_ITEM2]
+    assert mapping.table.meta.client.batch_get_item.call_count == 2
+    mapping.table.meta.client.batch_get_item.assert_called_with(
+        RequestItems={"table_name": {"Keys": [unprocessed_key]}}
+    )
+    sleep.assert_called_once()
+
+
+def test_get_many_chunks(mapping, mocker):
+    mapping.table.meta.client.batch_get_item = mocker.MagicMock(return_value={})
+    assert list(mapping.get_many(str(i) for i in range(250))) == []
+    calls = mapping.table.meta.client.batch_get_item.call_args_list
+    assert [len(c.kwargs["RequestItems"]["table_name"]["Keys"]) for c in calls] == [
+        100,
+        100,
+        50,
+    ]